@@ -5,48 +5,109 @@ with accounts, transactions, loans, and customer management.
 """
 
 # Import required modules (import, from, as)
+import bisect
+import collections
 import datetime as dt
-from decimal import Decimal, getcontext
-from typing import Dict, List, Optional, Union
-
-# Set precision for decimal operations (global)
-getcontext().prec = 4
+import itertools
+import sys
+# Bind Decimal straight from the C implementation; the decimal wrapper
+# module falls back to a pure-Python version when _decimal is missing,
+# which would silently make every money operation ~100x slower
+try:
+    from _decimal import Decimal
+except ImportError:
+    from decimal import Decimal
+from typing import Deque, Dict, Iterator, List, NamedTuple, Optional, Sequence, Union
 
 # Constants (True, False, None)
 MIN_DEPOSIT = Decimal('50.00')
 MIN_WITHDRAWAL = Decimal('20.00')
 MAX_DAILY_WITHDRAWAL = Decimal('5000.00')
 LOAN_INTEREST_RATE = Decimal('0.08')  # 8% annual interest
+DEFAULT_HIGH_VALUE_THRESHOLD = Decimal('10000')
 LOAN_TERM_YEARS = 5
 
+# Reused Decimal constants: parsing a literal on every call adds up on hot paths
+_ZERO = Decimal('0')
+_ZERO_00 = Decimal('0.00')
+_CENT = Decimal('0.01')
+_ONE = Decimal('1')
+_TWELVE = Decimal('12')
+_TENTH = Decimal('0.1')
+
+# Monotonic ID sequences: cheaper than timestamp-based IDs and immune to
+# collisions when several operations land in the same microsecond
+_txn_seq = itertools.count(1)
+_loan_seq = itertools.count(1)
+_pmt_seq = itertools.count(1)
+
+# Seed data for new Bank instances, built once at import time
+_TEST_CUSTOMERS = (
+    ("CUST-1001", "John Doe", "john.doe@example.com", "555-0101"),
+    ("CUST-1002", "Jane Smith", "jane.smith@example.com", "555-0102"),
+    ("CUST-1003", "Robert Johnson", "robert.j@example.com", "555-0103"),
+)
+
+_TEST_ACCOUNTS = (
+    ("ACC-2001", "CUST-1001", "checking"),
+    ("ACC-2002", "CUST-1001", "savings"),
+    ("ACC-2003", "CUST-1002", "checking"),
+    ("ACC-2004", "CUST-1003", "savings"),
+)
+
+_TEST_DEPOSITS = (
+    ("ACC-2001", "1000.00"),
+    ("ACC-2002", "5000.00"),
+    ("ACC-2003", "2500.00"),
+    ("ACC-2004", "3000.00"),
+)
+
 
 # Custom exceptions (raise, class)
-class InsufficientFundsError(Exception):
+class BankError(Exception):
+    """Base class for all banking errors."""
+    pass
+
+
+class InsufficientFundsError(BankError):
     """Raised when account has insufficient funds for a transaction."""
     pass
 
 
-class InvalidAmountError(Exception):
+class InvalidAmountError(BankError):
     """Raised when an invalid amount is provided for a transaction."""
     pass
 
 
-class AccountNotFoundError(Exception):
+class AccountNotFoundError(BankError):
     """Raised when an account is not found."""
     pass
 
 
-class CustomerNotFoundError(Exception):
+class CustomerNotFoundError(BankError):
     """Raised when a customer is not found."""
     pass
 
 
+class LoanNotFoundError(BankError):
+    """Raised when a loan is not found."""
+    pass
+
+
+# Exceptions the CLI reports to the user instead of crashing on
+_USER_ERRORS = (BankError, ValueError, ArithmeticError, AssertionError)
+
+
 # Base class for all bank entities (class)
 class BankEntity:
     """Base class for all bank entities with common properties."""
-    
+
+    __slots__ = ("id", "name", "created_at")
+
     def __init__(self, id: str, name: str):
-        self.id = id
+        # Interned so registry lookups on the ID take the CPython dict
+        # pointer-compare fast path
+        self.id = sys.intern(id)
         self.name = name
         self.created_at = dt.datetime.now()
     
@@ -57,19 +118,26 @@ class BankEntity:
 # Customer class (nonlocal)
 class Customer(BankEntity):
     """Bank customer with personal details and accounts."""
-    
+
+    __slots__ = ("email", "phone", "accounts", "loans", "primary_account_id",
+                 "_total_balance")
+
     def __init__(self, id: str, name: str, email: str, phone: str):
         super().__init__(id, name)
         self.email = email
         self.phone = phone
         self.accounts: Dict[str, 'Account'] = {}
         self.loans: List['Loan'] = []
+        self.primary_account_id: Optional[str] = None  # First account opened
+        self._total_balance = _ZERO_00  # Incrementally maintained by Account mutations
     
     def add_account(self, account: 'Account') -> None:
         """Add an account to the customer."""
         if account.id in self.accounts:
             raise ValueError("Account already exists for this customer")
         self.accounts[account.id] = account
+        if self.primary_account_id is None:
+            self.primary_account_id = account.id
     
     def get_account(self, account_id: str) -> 'Account':
         """Get an account by ID."""
@@ -83,65 +151,97 @@ class Customer(BankEntity):
     
     def get_total_balance(self) -> Decimal:
         """Get the total balance across all accounts."""
-        return sum(account.balance for account in self.accounts.values())
+        return self._total_balance
 
 
 # Account class (is, and, or, not)
 class Account(BankEntity):
     """Bank account with transaction capabilities."""
-    
+
+    __slots__ = ("customer", "account_type", "balance", "transactions", "is_active", "bank",
+                 "_daily_withdrawn", "_daily_date")
+
     def __init__(self, id: str, customer: Customer, account_type: str = "checking"):
         super().__init__(id, f"{account_type.title()} Account")
         self.customer = customer
-        self.account_type = account_type
-        self.balance = Decimal('0.00')
-        self.transactions: List['Transaction'] = []
+        self.account_type = sys.intern(account_type)
+        self.balance = _ZERO_00
+        # Ring buffer: old transactions age out instead of growing forever
+        self.transactions: Deque['Transaction'] = collections.deque(maxlen=10_000)
         self.is_active = True
+        self.bank: Optional['Bank'] = None  # Set when registered with a Bank
+        # Running total of today's withdrawals, so the daily cap is enforced
+        # cumulatively without scanning the transaction history
+        self._daily_withdrawn = _ZERO_00
+        self._daily_date = dt.date.today()
     
-    def deposit(self, amount: Union[Decimal, float, str]) -> 'Transaction':
+    def deposit(self, amount: Union[Decimal, float, str],
+                _now: Optional[dt.datetime] = None) -> 'Transaction':
         """Deposit money into the account."""
+        if not self.is_active:
+            raise ValueError("Account is inactive")
+
         amount = self._validate_amount(amount)
-        
+
         if amount < MIN_DEPOSIT:
             raise InvalidAmountError(f"Minimum deposit is {MIN_DEPOSIT}")
-        
-        transaction = Transaction(
-            transaction_id=f"TXN-{dt.datetime.now().timestamp()}",
+
+        transaction = _TxnPool.acquire(
+            transaction_id=f"TXN-{next(_txn_seq)}",
             account=self,
             amount=amount,
             transaction_type="deposit",
-            description="Account deposit"
+            description="Account deposit",
+            _now=_now
         )
         
         self.balance += amount
+        old_total = self.customer._total_balance
+        self.customer._total_balance = old_total + amount
+        if self.bank is not None:
+            self.bank._total_deposits += amount
+            self.bank._reindex_customer(self.customer, old_total)
         self.transactions.append(transaction)
         return transaction
-    
-    def withdraw(self, amount: Union[Decimal, float, str]) -> 'Transaction':
+
+    def withdraw(self, amount: Union[Decimal, float, str],
+                 _now: Optional[dt.datetime] = None) -> 'Transaction':
         """Withdraw money from the account."""
-        amount = self._validate_amount(amount)
-        
         if not self.is_active:
             raise ValueError("Account is inactive")
-        
+
+        amount = self._validate_amount(amount)
+
         if amount < MIN_WITHDRAWAL:
             raise InvalidAmountError(f"Minimum withdrawal is {MIN_WITHDRAWAL}")
-        
-        if amount > MAX_DAILY_WITHDRAWAL:
+
+        today = dt.date.today()
+        if today != self._daily_date:
+            self._daily_date = today
+            self._daily_withdrawn = _ZERO_00
+
+        if self._daily_withdrawn + amount > MAX_DAILY_WITHDRAWAL:
             raise InvalidAmountError(f"Maximum daily withdrawal is {MAX_DAILY_WITHDRAWAL}")
-        
+
         if amount > self.balance:
             raise InsufficientFundsError("Insufficient funds for withdrawal")
         
-        transaction = Transaction(
-            transaction_id=f"TXN-{dt.datetime.now().timestamp()}",
+        transaction = _TxnPool.acquire(
+            transaction_id=f"TXN-{next(_txn_seq)}",
             account=self,
             amount=-amount,  # Negative for withdrawals
             transaction_type="withdrawal",
-            description="Account withdrawal"
+            description="Account withdrawal",
+            _now=_now
         )
         
         self.balance -= amount
+        old_total = self.customer._total_balance
+        self.customer._total_balance = old_total - amount
+        self._daily_withdrawn += amount
+        if self.bank is not None:
+            self.bank._total_deposits -= amount
+            self.bank._reindex_customer(self.customer, old_total)
         self.transactions.append(transaction)
         return transaction
     
@@ -154,56 +254,80 @@ class Account(BankEntity):
         
         if not recipient.is_active:
             raise ValueError("Recipient account is inactive")
-        
+
+        # One clock read for the whole transfer; the withdrawal, deposit and
+        # transfer records all share it
+        now = dt.datetime.now()
+
         # Withdraw from this account
-        withdrawal = self.withdraw(amount)
-        
+        withdrawal = self.withdraw(amount, _now=now)
+
         # Deposit to recipient account
-        deposit = recipient.deposit(amount)
-        
+        deposit = recipient.deposit(amount, _now=now)
+
         # Create a transfer transaction record
-        transaction = Transaction(
-            transaction_id=f"TXN-{dt.datetime.now().timestamp()}",
+        transaction = _TxnPool.acquire(
+            transaction_id=f"TXN-{next(_txn_seq)}",
             account=self,
             amount=-amount,
             transaction_type="transfer",
-            description=f"Transfer to account {recipient.id}"
+            description=f"Transfer to account {recipient.id}",
+            _now=now
         )
         
         self.transactions.append(transaction)
         return transaction
     
-    def _validate_amount(self, amount: Union[Decimal, float, str]) -> Decimal:
+    def _validate_amount(self, amount: Union[Decimal, int, float, str]) -> Decimal:
         """Validate and convert amount to Decimal."""
-        if isinstance(amount, Decimal):
+        # Exact type checks keep the common cases on a branch-per-type fast
+        # path with no intermediate str allocation
+        t = type(amount)
+        if t is Decimal:
+            pass
+        elif t is int:
+            amount = Decimal(amount)
+        elif t is float:
+            amount = Decimal(repr(amount)).quantize(_CENT)
+        elif t is str:
+            amount = Decimal(amount)
+        elif isinstance(amount, Decimal):  # Decimal subclass
             pass
-        elif isinstance(amount, (float, str)):
-            amount = Decimal(str(amount))
         else:
             raise InvalidAmountError("Amount must be a number")
-        
-        if amount <= Decimal('0.00'):
+
+        if amount <= _ZERO:
             raise InvalidAmountError("Amount must be positive")
-        
+
         return amount
     
-    def get_transaction_history(self, limit: Optional[int] = None) -> List['Transaction']:
-        """Get transaction history with optional limit."""
-        return self.transactions[-limit:] if limit is not None else self.transactions.copy()
+    def get_transaction_history(self, limit: Optional[int] = None) -> Sequence['Transaction']:
+        """Get transaction history with optional limit.
+
+        The full history comes back as an immutable tuple snapshot; limited
+        queries materialize only the tail they asked for.
+        """
+        if limit is None:
+            return tuple(self.transactions)
+        start = max(0, len(self.transactions) - limit)
+        return list(itertools.islice(self.transactions, start, None))
 
 
 # Transaction class (yield)
 class Transaction:
     """Financial transaction record."""
-    
-    def __init__(self, transaction_id: str, account: Account, amount: Decimal, 
-                 transaction_type: str, description: str):
+
+    __slots__ = ("id", "account", "amount", "type", "description", "timestamp", "status")
+
+    def __init__(self, transaction_id: str, account: Account, amount: Decimal,
+                 transaction_type: str, description: str,
+                 _now: Optional[dt.datetime] = None):
         self.id = transaction_id
         self.account = account
         self.amount = amount
         self.type = transaction_type
         self.description = description
-        self.timestamp = dt.datetime.now()
+        self.timestamp = _now or dt.datetime.now()
         self.status = "completed"
     
     def __str__(self) -> str:
@@ -216,7 +340,7 @@ class Transaction:
             raise ValueError("Cannot reverse a non-completed transaction")
         
         # Create a reversal transaction
-        reversal = Transaction(
+        reversal = _TxnPool.acquire(
             transaction_id=f"RVSL-{self.id}",
             account=self.account,
             amount=-self.amount,
@@ -226,17 +350,106 @@ class Transaction:
         
         # Update account balance
         self.account.balance += self.amount
+        old_total = self.account.customer._total_balance
+        self.account.customer._total_balance = old_total + self.amount
+        if self.account.bank is not None:
+            self.account.bank._total_deposits += self.amount
+            self.account.bank._reindex_customer(self.account.customer, old_total)
         self.account.transactions.append(reversal)
         self.status = "reversed"
         
         return reversal
 
 
+# Transaction pool: recycles released Transaction instances so that
+# transaction-heavy workloads re-initialize objects instead of allocating
+class _TxnPool:
+    """Pool of recycled Transaction instances."""
+
+    _free: collections.deque = collections.deque(maxlen=4096)
+    _reused = 0
+    _created = 0
+
+    @classmethod
+    def acquire(cls, transaction_id: str, account: Account, amount: Decimal,
+                transaction_type: str, description: str,
+                _now: Optional[dt.datetime] = None) -> Transaction:
+        """Get a transaction, reusing a released instance when available."""
+        if cls._free:
+            transaction = cls._free.pop()
+            transaction.__init__(transaction_id, account, amount,
+                                 transaction_type, description, _now)
+            cls._reused += 1
+        else:
+            transaction = Transaction(transaction_id, account, amount,
+                                      transaction_type, description, _now)
+            cls._created += 1
+        return transaction
+
+    @classmethod
+    def release(cls, transaction: Transaction) -> None:
+        """Return a transaction to the pool once no caller holds it.
+
+        A transaction still sitting in its account's ledger is left
+        alone — re-initializing it there would rewrite history — so
+        release only pools records after ring-buffer eviction.
+        """
+        if transaction in transaction.account.transactions:
+            return
+        cls._free.append(transaction)
+
+    @classmethod
+    def stats(cls) -> Dict:
+        """Get pool usage counters."""
+        return {'pooled': len(cls._free), 'reused': cls._reused, 'created': cls._created}
+
+
+def _amortize_cents(balance_cents: int, rate_num: int, rate_den: int,
+                    payment_cents: int, n: int) -> Iterator[tuple]:
+    """Run the amortization recurrence in exact integer cents.
+
+    The monthly rate comes in as the integer fraction rate_num/rate_den and
+    interest rounds half-up to the nearest cent, so every row is exact —
+    no float error, no Decimal allocation. Pure-numeric core kept free of
+    Decimal, dicts and attribute access; yields (payment, principal,
+    interest, balance) tuples in cents, one month at a time.
+    """
+    half_den = rate_den // 2
+    for k in range(n):
+        interest = (balance_cents * rate_num + half_den) // rate_den
+        principal = payment_cents - interest
+        payment = payment_cents
+
+        if k == n - 1:  # Last payment adjustment
+            principal = balance_cents
+            payment = principal + interest
+
+        balance_cents -= principal
+        yield (payment, principal, interest,
+               balance_cents if balance_cents > 0 else 0)
+
+        if balance_cents <= 0:
+            break
+
+
+class AmortRow(NamedTuple):
+    month: int
+    payment: Decimal
+    principal: Decimal
+    interest: Decimal
+    balance: Decimal
+
+
 # Loan class (assert)
 class Loan(BankEntity):
     """Bank loan with amortization schedule."""
-    
-    def __init__(self, id: str, customer: Customer, amount: Decimal, 
+
+    __slots__ = ("customer", "original_amount", "remaining_amount", "interest_rate",
+                 "term_months", "start_date", "payments", "is_active",
+                 "_monthly_rate", "_rate_num", "_rate_den", "_rate_pct_str",
+                 "_monthly_payment", "_schedule", "_payment_count")
+
+    def __init__(self, id: str, customer: Customer, amount: Decimal,
                  interest_rate: Decimal = LOAN_INTEREST_RATE, 
                  term_years: int = LOAN_TERM_YEARS):
         super().__init__(id, f"Loan #{id[-6:]}")
@@ -245,45 +458,64 @@ class Loan(BankEntity):
         self.remaining_amount = amount
         self.interest_rate = interest_rate
         self.term_months = term_years * 12
-        self.start_date = dt.datetime.now().date()
+        self.start_date = dt.date.today()
         self.payments: List['LoanPayment'] = []
+        self._payment_count = 0
         self.is_active = True
-        
+        self._monthly_rate = interest_rate / _TWELVE
+        # Monthly rate as an exact integer fraction for the cents kernel
+        num, den = interest_rate.as_integer_ratio()
+        self._rate_num = num
+        self._rate_den = den * 12
+        # Display string computed once; the rate never changes
+        self._rate_pct_str = f"{interest_rate * 100:.2f}"
+        # Lazily computed caches; both are pure functions of the loan terms,
+        # which never change after origination
+        self._monthly_payment: Optional[Decimal] = None
+        self._schedule: Optional[List[AmortRow]] = None
+
         # Validate loan parameters
-        assert amount > Decimal('0'), "Loan amount must be positive"
-        assert interest_rate > Decimal('0'), "Interest rate must be positive"
+        assert amount > _ZERO, "Loan amount must be positive"
+        assert interest_rate > _ZERO, "Interest rate must be positive"
         assert term_years > 0, "Loan term must be at least 1 year"
     
+    @property
+    def monthly_payment(self) -> Decimal:
+        """Monthly payment amount, computed once on first access."""
+        return self.calculate_monthly_payment()
+
     def calculate_monthly_payment(self) -> Decimal:
         """Calculate monthly payment using amortization formula."""
-        monthly_rate = self.interest_rate / Decimal('12')
-        factor = (Decimal('1') + monthly_rate) ** self.term_months
-        payment = (self.original_amount * monthly_rate * factor) / (factor - Decimal('1'))
-        return payment.quantize(Decimal('0.01'))
+        if self._monthly_payment is None:
+            monthly_rate = self._monthly_rate
+            factor = (_ONE + monthly_rate) ** self.term_months
+            payment = (self.original_amount * monthly_rate * factor) / (factor - _ONE)
+            self._monthly_payment = payment.quantize(_CENT)
+        return self._monthly_payment
     
     def make_payment(self, amount: Decimal, payment_date: Optional[dt.date] = None) -> 'LoanPayment':
         """Make a payment toward the loan."""
         if not self.is_active:
             raise ValueError("Loan is not active")
         
-        if amount <= Decimal('0'):
+        if amount <= _ZERO:
             raise InvalidAmountError("Payment amount must be positive")
         
         if amount > self.remaining_amount:
             amount = self.remaining_amount  # Accept partial payment to close loan
         
-        payment_date = payment_date or dt.datetime.now().date()
+        payment_date = payment_date or dt.date.today()
         
         # Calculate interest and principal portions
-        interest = self.remaining_amount * (self.interest_rate / Decimal('12'))
+        interest = self.remaining_amount * self._monthly_rate
         if amount <= interest:
-            principal = Decimal('0')
+            principal = _ZERO
             interest = amount
         else:
             principal = amount - interest
         
         payment = LoanPayment(
-            payment_id=f"PMT-{dt.datetime.now().timestamp()}",
+            payment_id=f"PMT-{next(_pmt_seq)}",
             loan=self,
             amount=amount,
             principal=principal,
@@ -293,46 +525,52 @@ class Loan(BankEntity):
         
         self.remaining_amount -= principal
         self.payments.append(payment)
+        self._payment_count += 1
         
-        if self.remaining_amount <= Decimal('0'):
+        if self.remaining_amount <= _ZERO:
             self.is_active = False
         
         return payment
     
-    def generate_amortization_schedule(self) -> List[Dict]:
+    def iter_amortization_schedule(self) -> Iterator[AmortRow]:
+        """Yield amortization schedule rows lazily, one month at a time.
+
+        Consumers that only want the first few rows (e.g. the CLI preview)
+        never pay for the rest of the term.
+        """
+        if self._schedule is not None:
+            yield from self._schedule
+            return
+
+        # The recurrence runs in integer cents inside _amortize_cents
+        # (Decimal arithmetic allocates a new object per operation and is
+        # ~50x slower, and floats drift); only the rows handed back to
+        # callers are converted to Decimal, via scaleb which just shifts
+        # the exponent.
+        rows = _amortize_cents(int(self.original_amount.scaleb(2)),
+                               self._rate_num, self._rate_den,
+                               int(self.monthly_payment.scaleb(2)),
+                               self.term_months)
+
+        for month, (payment, principal, interest, balance) in enumerate(rows, start=1):
+            yield AmortRow(
+                month=month,
+                payment=Decimal(payment).scaleb(-2),
+                principal=Decimal(principal).scaleb(-2),
+                interest=Decimal(interest).scaleb(-2),
+                balance=Decimal(balance).scaleb(-2)
+            )
+
+    def generate_amortization_schedule(self) -> List[AmortRow]:
         """Generate full amortization schedule for the loan."""
-        schedule = []
-        balance = self.original_amount
-        monthly_payment = self.calculate_monthly_payment()
-        monthly_rate = self.interest_rate / Decimal('12')
-        
-        for month in range(1, self.term_months + 1):
-            interest = balance * monthly_rate
-            principal = monthly_payment - interest
-            
-            if month == self.term_months:  # Last payment adjustment
-                principal = balance
-                monthly_payment = principal + interest
-            
-            balance -= principal
-            
-            schedule.append({
-                'month': month,
-                'payment': monthly_payment,
-                'principal': principal,
-                'interest': interest,
-                'balance': max(balance, Decimal('0'))  # Ensure balance doesn't go negative
-            })
-            
-            if balance <= Decimal('0'):
-                break
-        
-        return schedule
-    
-    def get_remaining_payments(self) -> List[Dict]:
+        if self._schedule is None:
+            self._schedule = list(self.iter_amortization_schedule())
+        return self._schedule
+
+    def get_remaining_payments(self) -> List[AmortRow]:
         """Get remaining payments based on actual payments made."""
         amortization = self.generate_amortization_schedule()
-        payments_made = len(self.payments)
+        payments_made = self._payment_count
         
         if payments_made >= len(amortization):
             return []
@@ -343,8 +581,10 @@ class Loan(BankEntity):
 # LoanPayment class (try, except, finally)
 class LoanPayment:
     """Record of a loan payment."""
-    
-    def __init__(self, payment_id: str, loan: Loan, amount: Decimal, 
+
+    __slots__ = ("id", "loan", "amount", "principal", "interest", "payment_date")
+
+    def __init__(self, payment_id: str, loan: Loan, amount: Decimal,
                  principal: Decimal, interest: Decimal, payment_date: dt.date):
         self.id = payment_id
         self.loan = loan
@@ -352,12 +592,61 @@ class LoanPayment:
         self.principal = principal
         self.interest = interest
         self.payment_date = payment_date
-        
+
         # Validate payment amounts
-        try:
-            assert abs((principal + interest) - amount) < Decimal('0.01'), "Payment amounts don't add up"
-        except AssertionError as e:
-            raise ValueError(f"Invalid payment amounts: {e}")
+        if abs((principal + interest) - amount) >= _CENT:
+            raise ValueError("Invalid payment amounts: principal + interest != amount")
+
+
+# Summary records: fixed-schema NamedTuples instead of per-call dicts, so a
+# summary costs one flat tuple per record rather than a hash table each
+class CustomerInfo(NamedTuple):
+    id: str
+    name: str
+    email: str
+    phone: str
+
+
+class AccountSummary(NamedTuple):
+    id: str
+    type: str
+    balance: float
+    is_active: bool
+
+
+class LoanSummary(NamedTuple):
+    id: str
+    original_amount: float
+    remaining_amount: float
+    interest_rate: float
+    is_active: bool
+
+
+class CustomerSummary(NamedTuple):
+    customer: CustomerInfo
+    accounts: List[AccountSummary]
+    loans: List[LoanSummary]
+    total_balance: float
+
+
+class BankReport(NamedTuple):
+    bank_name: str
+    total_customers: int
+    total_accounts: int
+    active_accounts: int
+    total_deposits_cents: int
+    total_loans_cents: int
+    loan_to_deposit_ratio: float
+
+
+def _fmt_money_sep(cents: int) -> str:
+    """Format integer cents as a thousands-separated dollar string.
+
+    One divmod and two int formats replace the grouped-precision
+    Decimal.__format__ path, the slowest way to print money.
+    """
+    q, r = divmod(cents, 100)
+    return f"{q:,}.{r:02d}"
 
 
 # Bank class (with, del, lambda)
@@ -370,58 +659,83 @@ class Bank:
         self.accounts: Dict[str, Account] = {}
         self.loans: Dict[str, Loan] = {}
         self.transactions: List[Transaction] = []
-        
+        # Running aggregates maintained at the mutation points, so
+        # generate_report never has to re-scan the registries
+        self._total_deposits = _ZERO_00  # Maintained incrementally by Account mutations
+        self._total_loans = _ZERO_00
+        self._active_accounts = 0
+        # Sorted index of (total_balance, customer_id), kept in step with
+        # balance changes so threshold queries are a binary search
+        self._customers_by_balance: List[tuple] = []
+
         # Initialize with some test data
         self._initialize_test_data()
     
     def _initialize_test_data(self) -> None:
         """Initialize the bank with some test data."""
-        # Add some customers
-        customers = [
-            ("CUST-1001", "John Doe", "john.doe@example.com", "555-0101"),
-            ("CUST-1002", "Jane Smith", "jane.smith@example.com", "555-0102"),
-            ("CUST-1003", "Robert Johnson", "robert.j@example.com", "555-0103"),
-        ]
-        
-        for cust_id, name, email, phone in customers:
-            self.add_customer(Customer(cust_id, name, email, phone))
-        
-        # Add some accounts
-        accounts = [
-            ("ACC-2001", "CUST-1001", "checking"),
-            ("ACC-2002", "CUST-1001", "savings"),
-            ("ACC-2003", "CUST-1002", "checking"),
-            ("ACC-2004", "CUST-1003", "savings"),
-        ]
-        
+        self.bulk_load([Customer(*row) for row in _TEST_CUSTOMERS],
+                       _TEST_ACCOUNTS, _TEST_DEPOSITS)
+
+    def bulk_load(self, customers: List[Customer], accounts: List[tuple],
+                  deposits: List[tuple]) -> None:
+        """Load customers, accounts and opening balances in bulk.
+
+        Intended for trusted seed/import data: writes the registries
+        directly instead of going through per-call validation, and applies
+        opening balances without creating Transaction records, while
+        keeping the incremental totals consistent.
+        """
+        self.customers.update({customer.id: customer for customer in customers})
+
         for acc_id, cust_id, acc_type in accounts:
-            customer = self.get_customer(cust_id)
+            customer = self.customers[cust_id]
             account = Account(acc_id, customer, acc_type)
-            self.add_account(account)
-        
-        # Make some initial deposits
-        initial_deposits = [
-            ("ACC-2001", "1000.00"),
-            ("ACC-2002", "5000.00"),
-            ("ACC-2003", "2500.00"),
-            ("ACC-2004", "3000.00"),
-        ]
-        
-        for acc_id, amount in initial_deposits:
-            account = self.get_account(acc_id)
-            account.deposit(Decimal(amount))
+            account.bank = self
+            self.accounts[acc_id] = account
+            customer.accounts[acc_id] = account
+            self._active_accounts += 1
+            if customer.primary_account_id is None:
+                customer.primary_account_id = acc_id
+
+        for acc_id, amount in deposits:
+            account = self.accounts[acc_id]
+            amount = Decimal(amount)
+            account.balance += amount
+            account.customer._total_balance += amount
+            self._total_deposits += amount
+
+        # One rebuild is cheaper than reindexing per row
+        self._customers_by_balance = sorted(
+            (customer._total_balance, customer.id)
+            for customer in self.customers.values())
     
     def add_customer(self, customer: Customer) -> None:
         """Add a customer to the bank."""
         if customer.id in self.customers:
             raise ValueError(f"Customer with ID {customer.id} already exists")
         self.customers[customer.id] = customer
+        bisect.insort(self._customers_by_balance,
+                      (customer._total_balance, customer.id))
+
+    def _reindex_customer(self, customer: Customer, old_total: Decimal) -> None:
+        """Move a customer's entry in the balance index to its new position."""
+        # Accounts can belong to customers never registered with the bank;
+        # those stay out of the index, as reports only cover registered ones
+        if customer.id not in self.customers:
+            return
+        index = self._customers_by_balance
+        entry = (old_total, customer.id)
+        i = bisect.bisect_left(index, entry)
+        if i < len(index) and index[i] == entry:
+            del index[i]
+        bisect.insort(index, (customer._total_balance, customer.id))
     
     def get_customer(self, customer_id: str) -> Customer:
         """Get a customer by ID."""
-        if customer_id not in self.customers:
+        customer = self.customers.get(customer_id)
+        if customer is None:
             raise CustomerNotFoundError(f"Customer {customer_id} not found")
-        return self.customers[customer_id]
+        return customer
     
     def add_account(self, account: Account) -> None:
         """Add an account to the bank."""
@@ -429,453 +743,628 @@ class Bank:
             raise ValueError(f"Account with ID {account.id} already exists")
         
         self.accounts[account.id] = account
+        account.bank = self
+        self._total_deposits += account.balance
+        if account.is_active:
+            self._active_accounts += 1
         account.customer.add_account(account)
+
+        # An account funded before registration changed the customer's
+        # total while no bank was attached, so whatever entry the index
+        # holds for them is stale; re-place it with the true total
+        customer = account.customer
+        if customer.id in self.customers:
+            index = self._customers_by_balance
+            for i, (_, cust_id) in enumerate(index):
+                if cust_id == customer.id:
+                    del index[i]
+                    break
+            bisect.insort(index, (customer._total_balance, customer.id))
     
     def get_account(self, account_id: str) -> Account:
         """Get an account by ID."""
-        if account_id not in self.accounts:
+        account = self.accounts.get(account_id)
+        if account is None:
             raise AccountNotFoundError(f"Account {account_id} not found")
-        return self.accounts[account_id]
+        return account
     
     def close_account(self, account_id: str) -> None:
         """Close a bank account."""
         account = self.get_account(account_id)
-        
-        if account.balance != Decimal('0'):
+
+        if account.balance != _ZERO:
             raise ValueError("Cannot close account with non-zero balance")
-        
-        account.is_active = False
-        del self.accounts[account_id]  # Remove from bank's account registry
+
+        # Soft delete: is_active is the single closed marker. Removing the
+        # entry would leave the customer's accounts dict pointing at an
+        # account the bank no longer knows about.
+        if account.is_active:
+            account.is_active = False
+            self._active_accounts -= 1
     
     def transfer_funds(self, from_account_id: str, to_account_id: str, amount: Decimal) -> Transaction:
         """Transfer funds between accounts."""
         from_account = self.get_account(from_account_id)
         to_account = self.get_account(to_account_id)
         return from_account.transfer(amount, to_account)
+
+    def release_transaction(self, transaction: Transaction) -> None:
+        """Return a transaction record to the reuse pool.
+
+        Callers must not hold references to the transaction afterwards; it
+        may be re-initialized for a later operation. Records still in an
+        account's ledger are ignored and stay valid.
+        """
+        _TxnPool.release(transaction)
     
     def create_loan(self, customer_id: str, amount: Decimal) -> Loan:
         """Create a new loan for a customer."""
         customer = self.get_customer(customer_id)
         
         # Simple credit check - must have at least one account with sufficient balance
-        if customer.get_total_balance() < amount * Decimal('0.1'):
+        if customer.get_total_balance() < amount * _TENTH:
             raise ValueError("Insufficient creditworthiness for this loan amount")
         
-        loan_id = f"LOAN-{dt.datetime.now().timestamp()}"
+        # Disburse to the primary account first: if the deposit is refused
+        # (e.g. the account was closed) no half-registered loan is left
+        primary_account = customer.accounts[customer.primary_account_id]
+        primary_account.deposit(amount)
+
+        loan_id = f"LOAN-{next(_loan_seq)}"
         loan = Loan(loan_id, customer, amount)
-        
+
         self.loans[loan.id] = loan
         customer.add_loan(loan)
-        
-        # Disburse loan amount to customer's primary account (first account)
-        primary_account = next(iter(customer.accounts.values()))
-        primary_account.deposit(amount)
-        
+        self._total_loans += amount
+
         return loan
     
     def get_loan(self, loan_id: str) -> Loan:
         """Get a loan by ID."""
-        if loan_id not in self.loans:
-            raise ValueError(f"Loan {loan_id} not found")
-        return self.loans[loan_id]
+        loan = self.loans.get(loan_id)
+        if loan is None:
+            raise LoanNotFoundError(f"Loan {loan_id} not found")
+        return loan
     
-    def process_loan_payment(self, loan_id: str, amount: Decimal) -> LoanPayment:
-        """Process a payment toward a loan."""
+    def process_loan_payment(self, loan_id: str, amount: Decimal) -> tuple:
+        """Process a payment toward a loan.
+
+        Returns (payment, loan) so callers don't have to look the loan up
+        a second time to read its updated state.
+        """
         loan = self.get_loan(loan_id)
-        return loan.make_payment(amount)
+        payment = loan.make_payment(amount)
+        self._total_loans -= payment.principal
+        return payment, loan
     
-    def get_customer_summary(self, customer_id: str) -> Dict:
-        """Get a summary of a customer's accounts and loans."""
+    def get_customer_summary(self, customer_id: str) -> CustomerSummary:
+        """Get a summary of a customer's accounts and loans.
+
+        Callers needing plain dicts (e.g. for JSON output) can use the
+        NamedTuple _asdict() method at the boundary.
+        """
         customer = self.get_customer(customer_id)
-        
-        return {
-            'customer': {
-                'id': customer.id,
-                'name': customer.name,
-                'email': customer.email,
-                'phone': customer.phone
-            },
-            'accounts': [
-                {
-                    'id': acc.id,
-                    'type': acc.account_type,
-                    'balance': float(acc.balance),
-                    'is_active': acc.is_active
-                }
+
+        return CustomerSummary(
+            customer=CustomerInfo(customer.id, customer.name,
+                                  customer.email, customer.phone),
+            accounts=[
+                AccountSummary(acc.id, acc.account_type,
+                               float(acc.balance), acc.is_active)
                 for acc in customer.accounts.values()
             ],
-            'loans': [
-                {
-                    'id': loan.id,
-                    'original_amount': float(loan.original_amount),
-                    'remaining_amount': float(loan.remaining_amount),
-                    'interest_rate': float(loan.interest_rate),
-                    'is_active': loan.is_active
-                }
+            loans=[
+                LoanSummary(loan.id, float(loan.original_amount),
+                            float(loan.remaining_amount),
+                            float(loan.interest_rate), loan.is_active)
                 for loan in customer.loans
             ],
-            'total_balance': float(customer.get_total_balance())
-        }
+            total_balance=float(customer.get_total_balance())
+        )
     
-    def generate_report(self) -> Dict:
-        """Generate a summary report of the bank's status."""
-        total_deposits = sum(acc.balance for acc in self.accounts.values())
-        total_loans = sum(loan.remaining_amount for loan in self.loans.values())
-        
-        return {
-            'bank_name': self.name,
-            'total_customers': len(self.customers),
-            'total_accounts': len(self.accounts),
-            'active_accounts': sum(1 for acc in self.accounts.values() if acc.is_active),
-            'total_deposits': float(total_deposits),
-            'total_loans': float(total_loans),
-            'loan_to_deposit_ratio': float(total_loans / total_deposits) if total_deposits > 0 else 0.0
-        }
+    def generate_report(self) -> BankReport:
+        """Generate a summary report of the bank's status.
+
+        Every figure comes from a running aggregate or an O(1) dict length,
+        so the report costs the same for ten accounts or ten million.
+        """
+        total_deposits = self._total_deposits
+        total_loans = self._total_loans
+
+        return BankReport(
+            bank_name=self.name,
+            total_customers=len(self.customers),
+            total_accounts=len(self.accounts),
+            active_accounts=self._active_accounts,
+            total_deposits_cents=int(total_deposits.scaleb(2)),
+            total_loans_cents=int(total_loans.scaleb(2)),
+            loan_to_deposit_ratio=float(total_loans / total_deposits) if total_deposits > 0 else 0.0
+        )
     
-    def find_high_value_customers(self, threshold: Decimal = Decimal('10000.00')) -> List[Dict]:
-        """Find customers with total balances above a threshold."""
-        high_value = []
-        
-        for customer in self.customers.values():
-            total = customer.get_total_balance()
-            if total >= threshold:
-                high_value.append({
-                    'customer_id': customer.id,
-                    'name': customer.name,
-                    'total_balance': float(total),
-                    'account_count': len(customer.accounts)
-                })
-        
-        # Sort by total balance descending
-        return sorted(high_value, key=lambda x: x['total_balance'], reverse=True)
+    def find_high_value_customers(self, threshold: Decimal = Decimal('10000.00'),
+                                  limit: Optional[int] = None) -> List[Dict]:
+        """Find customers with total balances above a threshold.
+
+        A binary search on the balance index finds the cutoff, so the cost
+        is O(log N + k) for k matches instead of a scan over every
+        customer. The index is already sorted ascending; slicing from the
+        end honours an optional limit before anything is materialized.
+        """
+        index = self._customers_by_balance
+        start = bisect.bisect_left(index, (threshold, ""))
+        if limit is not None:
+            start = max(start, len(index) - limit)
+
+        customers = self.customers
+        return [
+            {
+                'customer_id': cust_id,
+                'name': customers[cust_id].name,
+                'total_balance': float(total),
+                'account_count': len(customers[cust_id].accounts)
+            }
+            for total, cust_id in reversed(index[start:])
+        ]
 
 
 # Main banking application (if, elif, else, while, for, break, continue, pass, def)
+# Static menu text, joined once at import time
+MAIN_MENU = ("\n=== Banking System Menu ===\n"
+             "1. Customer Services\n"
+             "2. Account Services\n"
+             "3. Loan Services\n"
+             "4. Reports\n"
+             "5. Exit")
+
+CUSTOMER_MENU = ("\nCustomer Services:\n"
+                 "1. Add Customer\n"
+                 "2. View Customer\n"
+                 "3. List All Customers\n"
+                 "4. Back to Main Menu")
+
+ACCOUNT_MENU = ("\nAccount Services:\n"
+                "1. Open Account\n"
+                "2. Close Account\n"
+                "3. Deposit\n"
+                "4. Withdraw\n"
+                "5. Transfer\n"
+                "6. View Transactions\n"
+                "7. Back to Main Menu")
+
+LOAN_MENU = ("\nLoan Services:\n"
+             "1. Apply for Loan\n"
+             "2. Make Loan Payment\n"
+             "3. View Loan Details\n"
+             "4. View Amortization Schedule\n"
+             "5. Back to Main Menu")
+
+REPORT_MENU = ("\nReports:\n"
+               "1. Bank Summary\n"
+               "2. High Value Customers\n"
+               "3. Back to Main Menu")
+
+# Bound once: the schedule loop calls this instead of re-driving an
+# f-string's five format operations per row
+_AMORT_FMT = "{:5}  {:>8}  {:>8}  {:>8}  {:>8}".format
+
+
+def _parse_money(prompt: str, default: Optional[Decimal] = None) -> Optional[Decimal]:
+    """Read a dollar amount from the user, or None if it isn't a number.
+
+    Bad input is caught with a plain string check and a friendly message
+    instead of letting Decimal raise — exception construction and traceback
+    capture is far more expensive than validating up front, and it let one
+    typo unwind an entire menu handler. When a default is given, an empty
+    reply returns it instead of being rejected.
+    """
+    raw = input(prompt).strip()
+    if not raw and default is not None:
+        return default
+    digits = raw[1:] if raw[:1] in "+-" else raw
+    # isdecimal, not isdigit: the latter passes characters like superscripts
+    # that Decimal rejects, which would break the no-raise contract
+    if digits.replace(".", "", 1).isdecimal():
+        return Decimal(raw)
+    print(f"'{raw}' is not a valid amount")
+    return None
+
+
+def _add_customer(bank: Bank) -> None:
+    """Add customer menu action."""
+    try:
+        cust_id = f"CUST-{int(dt.datetime.now().timestamp())}"
+        name = input("Customer name: ")
+        email = input("Email: ")
+        phone = input("Phone: ")
+
+        customer = Customer(cust_id, name, email, phone)
+        bank.add_customer(customer)
+        print(f"Added new customer: {customer}")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _view_customer(bank: Bank) -> None:
+    """View customer menu action."""
+    cust_id = input("Enter customer ID: ")
+    try:
+        customer = bank.get_customer(cust_id)
+        summary = bank.get_customer_summary(cust_id)
+
+        print(f"\nCustomer: {customer.name} (ID: {customer.id})")
+        print(f"Contact: {customer.email} | {customer.phone}")
+        print(f"Total Balance: ${summary.total_balance:.2f}")
+
+        print("\nAccounts:")
+        for acc in summary.accounts:
+            status = "Active" if acc.is_active else "Inactive"
+            print(f"- {acc.type.title()}: ${acc.balance:.2f} ({status})")
+
+        if summary.loans:
+            print("\nLoans:")
+            for loan in summary.loans:
+                status = "Active" if loan.is_active else "Paid"
+                print(f"- Loan {loan.id[-6:]}: "
+                      f"Original ${loan.original_amount:.2f}, "
+                      f"Remaining ${loan.remaining_amount:.2f} ({status})")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _list_customers(bank: Bank) -> None:
+    """List all customers menu action."""
+    print("\nAll Customers:")
+    for customer in bank.customers.values():
+        print(f"- {customer.id}: {customer.name} ({len(customer.accounts)} accounts)")
+
+
+def _open_account(bank: Bank) -> None:
+    """Open account menu action."""
+    try:
+        cust_id = input("Customer ID: ")
+        account_type = input("Account type (checking/savings): ")
+
+        if account_type.lower() not in ("checking", "savings"):
+            print("Account type must be 'checking' or 'savings'")
+            return
+
+        acc_id = f"ACC-{int(dt.datetime.now().timestamp())}"
+        customer = bank.get_customer(cust_id)
+        account = Account(acc_id, customer, account_type)
+        bank.add_account(account)
+
+        # Initial deposit
+        amount = _parse_money("Initial deposit amount: ")
+        if amount is None:
+            return
+        account.deposit(amount)
+
+        print(f"Opened new {account_type} account {acc_id} for {customer.name}")
+        print(f"Initial deposit of ${amount:.2f} received. New balance: ${account.balance:.2f}")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _close_account(bank: Bank) -> None:
+    """Close account menu action."""
+    try:
+        acc_id = input("Account ID to close: ")
+        bank.close_account(acc_id)
+        print(f"Account {acc_id} has been closed")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _deposit(bank: Bank) -> None:
+    """Deposit menu action."""
+    acc_id = input("Account ID: ")
+    amount = _parse_money("Amount to deposit: ")
+    if amount is None:
+        return
+    try:
+        account = bank.get_account(acc_id)
+        account.deposit(amount)
+
+        print(f"Deposited ${amount:.2f} to account {acc_id}")
+        print(f"New balance: ${account.balance:.2f}")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _withdraw(bank: Bank) -> None:
+    """Withdraw menu action."""
+    acc_id = input("Account ID: ")
+    amount = _parse_money("Amount to withdraw: ")
+    if amount is None:
+        return
+    try:
+        account = bank.get_account(acc_id)
+        account.withdraw(amount)
+
+        print(f"Withdrew ${amount:.2f} from account {acc_id}")
+        print(f"New balance: ${account.balance:.2f}")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _transfer(bank: Bank) -> None:
+    """Transfer menu action."""
+    from_acc = input("From Account ID: ")
+    to_acc = input("To Account ID: ")
+    amount = _parse_money("Amount to transfer: ")
+    if amount is None:
+        return
+    try:
+        bank.transfer_funds(from_acc, to_acc, amount)
+
+        print(f"Transferred ${amount:.2f} from {from_acc} to {to_acc}")
+        print(f"From account new balance: ${bank.get_account(from_acc).balance:.2f}")
+        print(f"To account new balance: ${bank.get_account(to_acc).balance:.2f}")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _view_transactions(bank: Bank) -> None:
+    """View transactions menu action."""
+    try:
+        acc_id = input("Account ID: ")
+        limit = input("Number of transactions to show (blank for all): ")
+        limit = int(limit) if limit.strip() else None
+
+        account = bank.get_account(acc_id)
+        transactions = account.get_transaction_history(limit)
+
+        print(f"\nTransaction history for account {acc_id}:")
+        for txn in reversed(transactions):
+            amount = f"+${txn.amount:.2f}" if txn.amount > 0 else f"-${abs(txn.amount):.2f}"
+            print(f"{txn.timestamp:%Y-%m-%d %H:%M} {txn.type:10} {amount:>10} - {txn.description}")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _apply_loan(bank: Bank) -> None:
+    """Apply for loan menu action."""
+    cust_id = input("Customer ID: ")
+    amount = _parse_money("Loan amount: ")
+    if amount is None:
+        return
+    try:
+        loan = bank.create_loan(cust_id, amount)
+        monthly_payment = loan.monthly_payment
+        customer_name = loan.customer.name
+
+        print(f"\nLoan {loan.id} approved for {customer_name}")
+        print(f"Amount: ${loan.original_amount:.2f}")
+        print(f"Interest Rate: {loan._rate_pct_str}%")
+        print(f"Term: {loan.term_months} months")
+        print(f"Monthly Payment: ${monthly_payment:.2f}")
+        print(f"Loan amount has been deposited to customer's primary account")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _pay_loan(bank: Bank) -> None:
+    """Make loan payment menu action."""
+    loan_id = input("Loan ID: ")
+    amount = _parse_money("Payment amount: ")
+    if amount is None:
+        return
+    try:
+        payment, loan = bank.process_loan_payment(loan_id, amount)
+
+        print(f"\nPayment of ${amount:.2f} received for loan {loan_id}")
+        print(f"Principal: ${payment.principal:.2f}")
+        print(f"Interest: ${payment.interest:.2f}")
+        print(f"Remaining Balance: ${loan.remaining_amount:.2f}")
+
+        if not loan.is_active:
+            print("\nCongratulations! This loan has been fully paid off!")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _view_loan(bank: Bank) -> None:
+    """View loan details menu action."""
+    try:
+        loan_id = input("Loan ID: ")
+        loan = bank.get_loan(loan_id)
+
+        print(f"\nLoan Details for {loan_id}:")
+        print(f"Customer: {loan.customer.name}")
+        print(f"Original Amount: ${loan.original_amount:.2f}")
+        print(f"Remaining Balance: ${loan.remaining_amount:.2f}")
+        print(f"Interest Rate: {loan._rate_pct_str}%")
+        print(f"Term: {loan.term_months} months")
+        print(f"Monthly Payment: ${loan.monthly_payment:.2f}")
+        print(f"Status: {'Active' if loan.is_active else 'Paid off'}")
+        print(f"Payments made: {loan._payment_count}")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _view_schedule(bank: Bank) -> None:
+    """View amortization schedule menu action."""
+    try:
+        loan_id = input("Loan ID: ")
+        loan = bank.get_loan(loan_id)
+
+        print(f"\nAmortization Schedule for Loan {loan_id}:")
+        print("Month  Payment    Principal  Interest   Balance")
+        print("----------------------------------------------")
+
+        # Pull only the 12 preview rows from the lazy iterator, then
+        # write them in one syscall instead of one flush per row
+        schedule = itertools.islice(loan.iter_amortization_schedule(), 12)
+        # Rows arrive cent-aligned from the integer kernel, so str()
+        # already prints two decimals — no need to go back through
+        # Decimal.__format__ per cell
+        lines = [_AMORT_FMT(pmt.month, str(pmt.payment), str(pmt.principal),
+                            str(pmt.interest), str(pmt.balance))
+                 for pmt in schedule]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        if loan.term_months > 12:
+            print("... (showing first 12 months)")
+    except _USER_ERRORS as e:
+        print(f"Error: {e}")
+
+
+def _bank_summary(bank: Bank) -> None:
+    """Bank summary report menu action."""
+    report = bank.generate_report()
+
+    sys.stdout.write(
+        f"\nBank Summary Report:\n"
+        f"Bank Name: {report.bank_name}\n"
+        f"Total Customers: {report.total_customers}\n"
+        f"Total Accounts: {report.total_accounts} ({report.active_accounts} active)\n"
+        f"Total Deposits: ${_fmt_money_sep(report.total_deposits_cents)}\n"
+        f"Total Loans: ${_fmt_money_sep(report.total_loans_cents)}\n"
+        f"Loan-to-Deposit Ratio: {report.loan_to_deposit_ratio:.2f}\n")
+
+
+def _high_value_customers(bank: Bank) -> None:
+    """High value customers report menu action."""
+    threshold = _parse_money("Enter balance threshold (default $10,000): ",
+                             DEFAULT_HIGH_VALUE_THRESHOLD)
+    if threshold is None:
+        return
+    high_value = bank.find_high_value_customers(threshold)
+
+    print(f"\nHigh Value Customers (Balance ≥ ${threshold:,.2f}):")
+    if not high_value:
+        print("No customers meet this threshold")
+    else:
+        for cust in high_value:
+            print(f"- {cust['name']}: ${cust['total_balance']:,.2f} "
+                  f"({cust['account_count']} accounts)")
+
+
+# O(1) dispatch tables: menu choice -> handler
+CUSTOMER_HANDLERS = {
+    "1": _add_customer,
+    "2": _view_customer,
+    "3": _list_customers,
+}
+
+ACCOUNT_HANDLERS = {
+    "1": _open_account,
+    "2": _close_account,
+    "3": _deposit,
+    "4": _withdraw,
+    "5": _transfer,
+    "6": _view_transactions,
+}
+
+LOAN_HANDLERS = {
+    "1": _apply_loan,
+    "2": _pay_loan,
+    "3": _view_loan,
+    "4": _view_schedule,
+}
+
+REPORT_HANDLERS = {
+    "1": _bank_summary,
+    "2": _high_value_customers,
+}
+
+
+def _customer_services(bank: Bank) -> None:
+    """Run the customer services submenu until the user backs out."""
+    # Bound lookups hoisted out of the per-keypress loop
+    lookup = CUSTOMER_HANDLERS.get
+    while True:
+        print(CUSTOMER_MENU)
+        sub_choice = input("Enter choice: ")
+
+        if sub_choice == "4":
+            break
+
+        handler = lookup(sub_choice)
+        if handler is not None:
+            handler(bank)
+        else:
+            print("Invalid choice, please try again")
+
+
+def _account_services(bank: Bank) -> None:
+    """Run the account services submenu until the user backs out."""
+    lookup = ACCOUNT_HANDLERS.get
+    while True:
+        print(ACCOUNT_MENU)
+        sub_choice = input("Enter choice: ")
+
+        if sub_choice == "7":
+            break
+
+        handler = lookup(sub_choice)
+        if handler is not None:
+            handler(bank)
+        else:
+            print("Invalid choice, please try again")
+
+
+def _loan_services(bank: Bank) -> None:
+    """Run the loan services submenu until the user backs out."""
+    lookup = LOAN_HANDLERS.get
+    while True:
+        print(LOAN_MENU)
+        sub_choice = input("Enter choice: ")
+
+        if sub_choice == "5":
+            break
+
+        handler = lookup(sub_choice)
+        if handler is not None:
+            handler(bank)
+        else:
+            print("Invalid choice, please try again")
+
+
+def _reports(bank: Bank) -> None:
+    """Run the reports submenu until the user backs out."""
+    lookup = REPORT_HANDLERS.get
+    while True:
+        print(REPORT_MENU)
+        sub_choice = input("Enter choice: ")
+
+        if sub_choice == "3":
+            break
+
+        handler = lookup(sub_choice)
+        if handler is not None:
+            handler(bank)
+        else:
+            print("Invalid choice, please try again")
+
+
+MAIN_HANDLERS = {
+    "1": _customer_services,
+    "2": _account_services,
+    "3": _loan_services,
+    "4": _reports,
+}
+
+
 def main():
     """Main banking application interface."""
     print("Initializing Banking System...\n")
     bank = Bank("Python Savings & Loan")
     
     # Customer menu (while)
+    lookup = MAIN_HANDLERS.get
     while True:
-        print("\n=== Banking System Menu ===")
-        print("1. Customer Services")
-        print("2. Account Services")
-        print("3. Loan Services")
-        print("4. Reports")
-        print("5. Exit")
-        
+        print(MAIN_MENU)
+
         choice = input("Enter your choice: ")
-        
-        if choice == "1":
-            # Customer services
-            while True:
-                print("\nCustomer Services:")
-                print("1. Add Customer")
-                print("2. View Customer")
-                print("3. List All Customers")
-                print("4. Back to Main Menu")
-                
-                sub_choice = input("Enter choice: ")
-                
-                if sub_choice == "1":
-                    # Add customer
-                    try:
-                        cust_id = f"CUST-{int(dt.datetime.now().timestamp())}"
-                        name = input("Customer name: ")
-                        email = input("Email: ")
-                        phone = input("Phone: ")
-                        
-                        customer = Customer(cust_id, name, email, phone)
-                        bank.add_customer(customer)
-                        print(f"Added new customer: {customer}")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "2":
-                    # View customer
-                    cust_id = input("Enter customer ID: ")
-                    try:
-                        customer = bank.get_customer(cust_id)
-                        summary = bank.get_customer_summary(cust_id)
-                        
-                        print(f"\nCustomer: {customer.name} (ID: {customer.id})")
-                        print(f"Contact: {customer.email} | {customer.phone}")
-                        print(f"Total Balance: ${summary['total_balance']:.2f}")
-                        
-                        print("\nAccounts:")
-                        for acc in summary['accounts']:
-                            status = "Active" if acc['is_active'] else "Inactive"
-                            print(f"- {acc['type'].title()}: ${acc['balance']:.2f} ({status})")
-                        
-                        if summary['loans']:
-                            print("\nLoans:")
-                            for loan in summary['loans']:
-                                status = "Active" if loan['is_active'] else "Paid"
-                                print(f"- Loan {loan['id'][-6:]}: "
-                                      f"Original ${loan['original_amount']:.2f}, "
-                                      f"Remaining ${loan['remaining_amount']:.2f} ({status})")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "3":
-                    # List all customers
-                    print("\nAll Customers:")
-                    for customer in bank.customers.values():
-                        print(f"- {customer.id}: {customer.name} ({len(customer.accounts)} accounts)")
-                
-                elif sub_choice == "4":
-                    break
-                else:
-                    print("Invalid choice, please try again")
-        
-        elif choice == "2":
-            # Account services
-            while True:
-                print("\nAccount Services:")
-                print("1. Open Account")
-                print("2. Close Account")
-                print("3. Deposit")
-                print("4. Withdraw")
-                print("5. Transfer")
-                print("6. View Transactions")
-                print("7. Back to Main Menu")
-                
-                sub_choice = input("Enter choice: ")
-                
-                if sub_choice == "1":
-                    # Open account
-                    try:
-                        cust_id = input("Customer ID: ")
-                        account_type = input("Account type (checking/savings): ")
-                        
-                        if account_type.lower() not in ("checking", "savings"):
-                            print("Account type must be 'checking' or 'savings'")
-                            continue
-                        
-                        acc_id = f"ACC-{int(dt.datetime.now().timestamp())}"
-                        customer = bank.get_customer(cust_id)
-                        account = Account(acc_id, customer, account_type)
-                        bank.add_account(account)
-                        
-                        # Initial deposit
-                        amount = input("Initial deposit amount: ")
-                        account.deposit(Decimal(amount))
-                        
-                        print(f"Opened new {account_type} account {acc_id} for {customer.name}")
-                        print(f"Initial deposit of ${amount} received. New balance: ${account.balance:.2f}")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "2":
-                    # Close account
-                    try:
-                        acc_id = input("Account ID to close: ")
-                        bank.close_account(acc_id)
-                        print(f"Account {acc_id} has been closed")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "3":
-                    # Deposit
-                    try:
-                        acc_id = input("Account ID: ")
-                        amount = Decimal(input("Amount to deposit: "))
-                        
-                        account = bank.get_account(acc_id)
-                        transaction = account.deposit(amount)
-                        
-                        print(f"Deposited ${amount:.2f} to account {acc_id}")
-                        print(f"New balance: ${account.balance:.2f}")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "4":
-                    # Withdraw
-                    try:
-                        acc_id = input("Account ID: ")
-                        amount = Decimal(input("Amount to withdraw: "))
-                        
-                        account = bank.get_account(acc_id)
-                        transaction = account.withdraw(amount)
-                        
-                        print(f"Withdrew ${amount:.2f} from account {acc_id}")
-                        print(f"New balance: ${account.balance:.2f}")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "5":
-                    # Transfer
-                    try:
-                        from_acc = input("From Account ID: ")
-                        to_acc = input("To Account ID: ")
-                        amount = Decimal(input("Amount to transfer: "))
-                        
-                        transaction = bank.transfer_funds(from_acc, to_acc, amount)
-                        
-                        print(f"Transferred ${amount:.2f} from {from_acc} to {to_acc}")
-                        print(f"From account new balance: ${bank.get_account(from_acc).balance:.2f}")
-                        print(f"To account new balance: ${bank.get_account(to_acc).balance:.2f}")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "6":
-                    # View transactions
-                    try:
-                        acc_id = input("Account ID: ")
-                        limit = input("Number of transactions to show (blank for all): ")
-                        limit = int(limit) if limit.strip() else None
-                        
-                        account = bank.get_account(acc_id)
-                        transactions = account.get_transaction_history(limit)
-                        
-                        print(f"\nTransaction history for account {acc_id}:")
-                        for txn in reversed(transactions):
-                            amount = f"+${txn.amount:.2f}" if txn.amount > 0 else f"-${abs(txn.amount):.2f}"
-                            print(f"{txn.timestamp:%Y-%m-%d %H:%M} {txn.type:10} {amount:>10} - {txn.description}")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "7":
-                    break
-                else:
-                    print("Invalid choice, please try again")
-        
-        elif choice == "3":
-            # Loan services
-            while True:
-                print("\nLoan Services:")
-                print("1. Apply for Loan")
-                print("2. Make Loan Payment")
-                print("3. View Loan Details")
-                print("4. View Amortization Schedule")
-                print("5. Back to Main Menu")
-                
-                sub_choice = input("Enter choice: ")
-                
-                if sub_choice == "1":
-                    # Apply for loan
-                    try:
-                        cust_id = input("Customer ID: ")
-                        amount = Decimal(input("Loan amount: "))
-                        
-                        loan = bank.create_loan(cust_id, amount)
-                        monthly_payment = loan.calculate_monthly_payment()
-                        
-                        print(f"\nLoan {loan.id} approved for {loan.customer.name}")
-                        print(f"Amount: ${loan.original_amount:.2f}")
-                        print(f"Interest Rate: {loan.interest_rate * 100:.2f}%")
-                        print(f"Term: {loan.term_months} months")
-                        print(f"Monthly Payment: ${monthly_payment:.2f}")
-                        print(f"Loan amount has been deposited to customer's primary account")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "2":
-                    # Make loan payment
-                    try:
-                        loan_id = input("Loan ID: ")
-                        amount = Decimal(input("Payment amount: "))
-                        
-                        payment = bank.process_loan_payment(loan_id, amount)
-                        loan = bank.get_loan(loan_id)
-                        
-                        print(f"\nPayment of ${amount:.2f} received for loan {loan_id}")
-                        print(f"Principal: ${payment.principal:.2f}")
-                        print(f"Interest: ${payment.interest:.2f}")
-                        print(f"Remaining Balance: ${loan.remaining_amount:.2f}")
-                        
-                        if not loan.is_active:
-                            print("\nCongratulations! This loan has been fully paid off!")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "3":
-                    # View loan details
-                    try:
-                        loan_id = input("Loan ID: ")
-                        loan = bank.get_loan(loan_id)
-                        
-                        print(f"\nLoan Details for {loan_id}:")
-                        print(f"Customer: {loan.customer.name}")
-                        print(f"Original Amount: ${loan.original_amount:.2f}")
-                        print(f"Remaining Balance: ${loan.remaining_amount:.2f}")
-                        print(f"Interest Rate: {loan.interest_rate * 100:.2f}%")
-                        print(f"Term: {loan.term_months} months")
-                        print(f"Monthly Payment: ${loan.calculate_monthly_payment():.2f}")
-                        print(f"Status: {'Active' if loan.is_active else 'Paid off'}")
-                        print(f"Payments made: {len(loan.payments)}")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "4":
-                    # View amortization schedule
-                    try:
-                        loan_id = input("Loan ID: ")
-                        loan = bank.get_loan(loan_id)
-                        
-                        print(f"\nAmortization Schedule for Loan {loan_id}:")
-                        print("Month  Payment    Principal  Interest   Balance")
-                        print("----------------------------------------------")
-                        
-                        schedule = loan.generate_amortization_schedule()
-                        for pmt in schedule[:12]:  # Show first 12 months
-                            print(f"{pmt['month']:5}  {pmt['payment']:8.2f}  {pmt['principal']:8.2f}  "
-                                  f"{pmt['interest']:8.2f}  {pmt['balance']:8.2f}")
-                        
-                        if len(schedule) > 12:
-                            print("... (showing first 12 months)")
-                    except Exception as e:
-                        print(f"Error: {e}")
-                
-                elif sub_choice == "5":
-                    break
-                else:
-                    print("Invalid choice, please try again")
-        
-        elif choice == "4":
-            # Reports
-            while True:
-                print("\nReports:")
-                print("1. Bank Summary")
-                print("2. High Value Customers")
-                print("3. Back to Main Menu")
-                
-                sub_choice = input("Enter choice: ")
-                
-                if sub_choice == "1":
-                    # Bank summary
-                    report = bank.generate_report()
-                    
-                    print("\nBank Summary Report:")
-                    print(f"Bank Name: {report['bank_name']}")
-                    print(f"Total Customers: {report['total_customers']}")
-                    print(f"Total Accounts: {report['total_accounts']} ({report['active_accounts']} active)")
-                    print(f"Total Deposits: ${report['total_deposits']:,.2f}")
-                    print(f"Total Loans: ${report['total_loans']:,.2f}")
-                    print(f"Loan-to-Deposit Ratio: {report['loan_to_deposit_ratio']:.2f}")
-                
-                elif sub_choice == "2":
-                    # High value customers
-                    threshold = Decimal(input("Enter balance threshold (default $10,000): ") or "10000")
-                    high_value = bank.find_high_value_customers(threshold)
-                    
-                    print(f"\nHigh Value Customers (Balance ≥ ${threshold:,.2f}):")
-                    if not high_value:
-                        print("No customers meet this threshold")
-                    else:
-                        for cust in high_value:
-                            print(f"- {cust['name']}: ${cust['total_balance']:,.2f} "
-                                  f"({cust['account_count']} accounts)")
-                
-                elif sub_choice == "3":
-                    break
-                else:
-                    print("Invalid choice, please try again")
-        
-        elif choice == "5":
+
+        if choice == "5":
             print("\nThank you for using the Banking System. Goodbye!")
             break
+
+        handler = lookup(choice)
+        if handler is not None:
+            handler(bank)
         else:
             print("Invalid choice, please try again")
 